@@ -1,35 +1,71 @@
+import asyncio
 import re
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import date
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
 from loguru import logger
 from mcp.server.fastmcp import FastMCP
 
-from mcp_camara.models import APIResponse, EndpointSummary
+from mcp_camara.models import APIResponse, Endpoint
 from mcp_camara.parser import get_endpoints, load_openapi_spec
 
 BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
 SPEC_URL = f"{BASE_URL}/api-docs"
 
+_PATH_PARAM_RE = re.compile(r"\{([^{}]+)\}")
+
+_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+
+_MISSING = object()
+
+_MAX_SUGGESTIONS = 20
+
+_DEPUTY_CACHE_TTL = 3600.0
+_DEPUTY_CACHE_MAX_SIZE = 512
+_deputy_cache: dict[str, tuple[float, APIResponse]] = {}
+_deputy_cache_locks: dict[str, asyncio.Lock] = {}
+
+_client = httpx.AsyncClient(
+    base_url=BASE_URL,
+    http2=True,
+    headers={"Accept": "application/json", "Accept-Encoding": "gzip, br"},
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=30.0,
+)
+
 spec = load_openapi_spec(SPEC_URL)
 
 endpoints = get_endpoints(spec)
 
-endpoints_summary = [
-    EndpointSummary(
-        path=endpoint.path,
-        method=endpoint.method,
-        description=endpoint.description
-    ) for endpoint in endpoints
-]
+_SUMMARY_FIELDS = {"path", "method", "description"}
+
+endpoints_summary = tuple(
+    endpoint.model_dump(include=_SUMMARY_FIELDS) for endpoint in endpoints
+)
 
-endpoints_mapping = {
-    f"{endpoint.method}:{endpoint.path}": endpoint
-    for endpoint in endpoints
-}
+endpoints_by_method: dict[str, dict[str, Endpoint]] = defaultdict(dict)
+for endpoint in endpoints:
+    endpoints_by_method[endpoint.method][endpoint.path] = endpoint
 
-mcp = FastMCP(name="mcp-camara")
+_LIST_ENDPOINTS_RESPONSE = APIResponse(status="success", results=endpoints_summary)
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        await _client.aclose()
+
+
+mcp = FastMCP(name="mcp-camara", lifespan=lifespan)
 
 
 @mcp.tool()
@@ -45,9 +81,30 @@ async def list_endpoints() -> APIResponse:
     execute it with the `call_endpoint` tool.
 
     Returns:
-        APIResponse: An APIResponse object containing a list of `EndpointSummary` objects.
+        APIResponse: An APIResponse object containing a list of endpoint summaries.
     """
-    return APIResponse(status="success", results=endpoints_summary)
+    return _LIST_ENDPOINTS_RESPONSE
+
+
+@lru_cache(maxsize=256)
+def _lookup_endpoint_response(method: str, path: str) -> APIResponse:
+    method_upper = method if method in _HTTP_METHODS else method.upper()
+
+    bucket = endpoints_by_method.get(method_upper)
+    endpoint = bucket.get(path) if bucket else None
+
+    if endpoint is None:
+        return APIResponse.model_construct(
+            status="error",
+            error_details={
+                "message": (
+                    f"Endpoint '{method} {path}' not found. "
+                    "Please use the `list_endpoints` tool to find a valid path and method combination."
+                )
+            }
+        )
+
+    return APIResponse.model_construct(status="success", results=endpoint)
 
 
 @mcp.tool()
@@ -67,22 +124,7 @@ async def get_endpoint_schema(path: str, method: str) -> APIResponse:
     Returns:
         APIResponse: An APIResponse object containing the Endpoint schema on success, or an error message.
     """
-    key = f"{method.upper()}:{path}"
-
-    endpoint = endpoints_mapping.get(key)
-
-    if endpoint is None:
-        return APIResponse(
-            status="error",
-            error_details={
-                "message": (
-                    f"Endpoint '{method} {path}' not found. "
-                    "Please use the `list_endpoints` tool to find a valid path and method combination."
-                )
-            }
-        )
-
-    return APIResponse(status="success", results=endpoint)
+    return _lookup_endpoint_response(method, path)
 
 
 @mcp.tool()
@@ -105,10 +147,10 @@ async def call_endpoint(path: str, method: str, params: dict[str, Any]) -> APIRe
     Returns:
         APIResponse: An APIResponse object containing the requested data on success, or an error message.
     """
-    method_upper = method.upper()
+    method_upper = method if method in _HTTP_METHODS else method.upper()
 
     if method_upper != "GET":
-        return APIResponse(
+        return APIResponse.model_construct(
             status="error",
             error_details={
                 "message": (
@@ -118,25 +160,29 @@ async def call_endpoint(path: str, method: str, params: dict[str, Any]) -> APIRe
             }
         )
 
-    for path_param in re.findall(r"\{([^{}]+)\}", path):
-        if param_value := params.get(path_param):
+    bucket = endpoints_by_method.get(method_upper)
+    endpoint = bucket.get(path) if bucket else None
+
+    path_params = endpoint.path_params if endpoint else _PATH_PARAM_RE.findall(path)
+
+    for path_param in path_params:
+        param_value = params.pop(path_param, _MISSING)
+        if param_value is not _MISSING:
             path = path.replace(f"{{{path_param}}}", str(param_value))
-            del params[path_param]
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method_upper,
-                url=f"{BASE_URL}{path}",
-                params=params
-            )
-            response.raise_for_status()
+        response = await _client.request(
+            method=method_upper,
+            url=path,
+            params=params
+        )
+        response.raise_for_status()
 
-        return APIResponse(status="success", results=response.json())
+        return APIResponse.model_construct(status="success", results=orjson.loads(response.content))
     except httpx.HTTPStatusError as e:
-        logger.exception("Error calling tool `call_endpoint`:")
         if e.response.status_code == httpx.codes.BAD_REQUEST:
-            return APIResponse(
+            logger.warning("Bad request calling tool `call_endpoint`: {}", e.request.url)
+            return APIResponse.model_construct(
                 status="error",
                 error_details={
                     "status_code": "400 Bad Request",
@@ -146,11 +192,25 @@ async def call_endpoint(path: str, method: str, params: dict[str, Any]) -> APIRe
                     )
                 }
             )
-        else:
-            return APIResponse(status="error", error_details={"message": str(e)})
+
+        logger.exception("Error calling tool `call_endpoint`:")
+        return APIResponse.model_construct(status="error", error_details={"message": str(e)})
     except Exception as e:
         logger.exception("Error calling tool `call_endpoint`:")
-        return APIResponse(status="error", error_details={"message": str(e)})
+        return APIResponse.model_construct(status="error", error_details={"message": str(e)})
+
+
+def _evict_deputy_cache(now: float) -> None:
+    """Drops expired entries, then the oldest ones, to keep the cache bounded."""
+    expired = [
+        key for key, (timestamp, _) in _deputy_cache.items()
+        if now - timestamp >= _DEPUTY_CACHE_TTL
+    ]
+    for key in expired:
+        del _deputy_cache[key]
+
+    while len(_deputy_cache) >= _DEPUTY_CACHE_MAX_SIZE:
+        del _deputy_cache[next(iter(_deputy_cache))]
 
 
 @mcp.tool()
@@ -165,11 +225,27 @@ async def get_deputy_by_name(name: str) -> APIResponse:
     Returns:
         APIResponse: An APIResponse object containing a list of deputies on success, or an error message.
     """
-    return await call_endpoint(
-        path="/deputados",
-        method="GET",
-        params={"nome": name},
-    )
+    lock = _deputy_cache_locks.setdefault(name, asyncio.Lock())
+    try:
+        async with lock:
+            now = time.monotonic()
+            cached = _deputy_cache.get(name)
+            if cached and now - cached[0] < _DEPUTY_CACHE_TTL:
+                return cached[1]
+
+            response = await call_endpoint(
+                path="/deputados",
+                method="GET",
+                params={"nome": name},
+            )
+
+            if response.status == "success":
+                _evict_deputy_cache(now)
+                _deputy_cache[name] = (time.monotonic(), response)
+
+            return response
+    finally:
+        _deputy_cache_locks.pop(name, None)
 
 
 @mcp.tool()
@@ -199,7 +275,7 @@ async def get_deputy_expenses(
 
     if deputy_id is None:
         if not name:
-            return APIResponse(
+            return APIResponse.model_construct(
                 status="error",
                 error_details={
                     "message": "You must provide either a `name` or an `id`."
@@ -214,7 +290,7 @@ async def get_deputy_expenses(
         deputies = deputies_response.results.get("dados", [])
 
         if not deputies:
-            return APIResponse(
+            return APIResponse.model_construct(
                 status="error",
                 error_details={
                     "message": f"No deputy found with name containing '{name}'."
@@ -222,13 +298,17 @@ async def get_deputy_expenses(
             )
 
         if len(deputies) > 1:
-            suggestions = [f"'{d['nome']}' (ID: {d['id']})" for d in deputies]
-            return APIResponse(
+            suggestions = ", ".join(
+                f"'{d['nome']}' (ID: {d['id']})" for d in deputies[:_MAX_SUGGESTIONS]
+            )
+            if len(deputies) > _MAX_SUGGESTIONS:
+                suggestions += f", ... and {len(deputies) - _MAX_SUGGESTIONS} more"
+            return APIResponse.model_construct(
                 status="error",
                 error_details={
                     "message": (
                         f"Multiple deputies found for '{name}'. "
-                        f"Please be more specific or use an ID. Suggestions: {', '.join(suggestions)}."
+                        f"Please be more specific or use an ID. Suggestions: {suggestions}."
                     )
                 }
             )
@@ -268,7 +348,7 @@ async def get_bills_by_deputy(deputy_id: int, years: list[str] | None = None) ->
     if deputy_id:
         params["idDeputadoAutor"] = deputy_id
     else:
-        return APIResponse(
+        return APIResponse.model_construct(
             status="error",
             error_details={"message": "You must provide `deputy_id`."}
         )
@@ -32,6 +32,7 @@ class Endpoint(EndpointSummary):
     """Represents a full API endpoint, including its summary and all of its parameters."""
 
     parameters: list[Parameter] = Field(description="A list of parameters that the endpoint accepts.")
+    path_params: tuple[str, ...] = Field(default=(), description="The names of the path parameters found in the endpoint path.")
 
 
 class APIResponse(BaseModel):
@@ -45,7 +46,7 @@ class APIResponse(BaseModel):
     error_details: Optional[dict[str, Any]] = Field(default=None, description="A dictionary containing error details. Only present if status is 'error'.")
 
     @model_validator(mode="after")
-    def check_passwords_match(self) -> Self:
+    def check_results_xor_error(self) -> Self:
         if (self.results is None) ^ (self.error_details is None):
             return self
         raise ValueError("Only one of 'results' or 'error_details' should be set")
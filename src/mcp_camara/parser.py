@@ -1,22 +1,55 @@
+import re
+import sys
+from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 from loguru import logger
 
-from mcp_camara.models import Endpoint, Parameter
+from mcp_camara.models import Endpoint, Parameter, ParameterSchema
 
 type APIPaths = dict[str, dict[str, dict]]
 
+_PATH_PARAM_RE = re.compile(r"\{([^{}]+)\}")
+
+_HTTP_METHODS = frozenset(("get", "post", "put", "patch", "delete", "head", "options", "trace"))
+
+CACHE_DIR = Path.home() / ".cache" / "mcp-camara"
+SPEC_CACHE_PATH = CACHE_DIR / "spec.json"
+ETAG_CACHE_PATH = CACHE_DIR / "spec.etag"
+
 
 def load_openapi_spec(url: str) -> dict[str, Any]:
-    logger.info(f"Loading spec from {url}")
+    logger.info("Loading spec from {}", url)
+
+    headers = {}
+    if SPEC_CACHE_PATH.exists() and ETAG_CACHE_PATH.exists():
+        headers["If-None-Match"] = ETAG_CACHE_PATH.read_text().strip()
+
     try:
-        response = httpx.get(url)
+        with httpx.Client(http2=True, timeout=30.0) as client:
+            response = client.get(url, headers=headers)
+
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.success("Spec unchanged, loaded from cache.")
+            return orjson.loads(SPEC_CACHE_PATH.read_bytes())
+
         response.raise_for_status()
-        logger.success(f"Spec load successfully.")
-        return response.json()
+        spec = orjson.loads(response.content)
+
+        if etag := response.headers.get("etag"):
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            SPEC_CACHE_PATH.write_bytes(response.content)
+            ETAG_CACHE_PATH.write_text(etag)
+
+        logger.success("Spec loaded successfully.")
+        return spec
     except Exception:
         logger.exception("Error loading spec:")
+        if SPEC_CACHE_PATH.exists():
+            logger.warning("Falling back to cached spec.")
+            return orjson.loads(SPEC_CACHE_PATH.read_bytes())
 
 
 def get_endpoints(openapi_spec: dict[str, Any]) -> list[Endpoint]:
@@ -27,18 +60,34 @@ def get_endpoints(openapi_spec: dict[str, Any]) -> list[Endpoint]:
 
     for path, path_methods in paths.items():
         for method, method_details in path_methods.items():
+            if method not in _HTTP_METHODS:
+                continue
 
-            parameters: list[dict] = []
-            method_parameters: list[dict] = method_details.get("parameters", [])
-            for param in method_parameters:
-                if param.get("in") in {"query", "path"}:
-                    parameters.append(Parameter(**param))
+            parameters: list[Parameter] = []
+            for param in method_details.get("parameters") or ():
+                location = param.get("in")
+                if location == "query" or location == "path":
+                    param_schema = param["schema"]
+                    param_format = param_schema.get("format")
+                    parameters.append(
+                        Parameter.model_construct(
+                            name=sys.intern(param["name"]),
+                            description=param.get("description"),
+                            required=param.get("required", False),
+                            schema=ParameterSchema.model_construct(
+                                type=sys.intern(param_schema["type"]),
+                                format=sys.intern(param_format) if param_format else None,
+                                default=param_schema.get("default")
+                            )
+                        )
+                    )
 
-            endpoint = Endpoint(
+            endpoint = Endpoint.model_construct(
                 path=path,
-                method=method.upper(),
+                method=sys.intern(method.upper()),
                 description=method_details.get("description") or method_details.get("summary"),
-                parameters=parameters
+                parameters=parameters,
+                path_params=tuple(_PATH_PARAM_RE.findall(path))
             )
 
             endpoints.append(endpoint)